@@ -5,7 +5,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_access_token, oauth2_scheme
 from app.db.session import get_db
@@ -53,7 +53,7 @@ def get_current_user_id(
 
 
 def get_notifications_service(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> NotificationsService:
     """
     Get notifications service instance with injected dependencies
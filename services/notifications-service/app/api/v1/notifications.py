@@ -30,7 +30,8 @@ async def get_my_notifications(
     date_from: Optional[datetime] = Query(default=None, alias="from", description="Filter by created_at >= date_from"),
     date_to: Optional[datetime] = Query(default=None, alias="to", description="Filter by created_at <= date_to"),
     offset: int = Query(default=0, ge=0, description="Number of records to skip"),
-    count: int = Query(default=20, ge=1, le=100, description="Maximum number of records to return")
+    count: int = Query(default=20, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor (next_cursor of the previous page)")
 ) -> NotificationsListResponse:
     """
     Get list of notifications for current user
@@ -44,6 +45,7 @@ async def get_my_notifications(
         date_to: Filter by created_at <= date_to (optional)
         offset: Number of records to skip
         count: Maximum number of records to return
+        cursor: Opaque cursor from a previous page; pages by keyset instead of offset
         
     Returns:
         List of notifications with pagination metadata
@@ -55,14 +57,15 @@ async def get_my_notifications(
             detail="Status must be one of: unread, read, all"
         )
     
-    return service.list_notifications(
+    return await service.list_notifications(
         user_id=current_user_id,
         status=status,
         notification_type=type,
         date_from=date_from,
         date_to=date_to,
         offset=offset,
-        count=count
+        count=count,
+        cursor=cursor
     )
 
 
@@ -90,7 +93,7 @@ async def mark_notification_read(
     Raises:
         HTTPException: 404 if notification not found, 403 if unauthorized
     """
-    return service.mark_notification_read(
+    return await service.mark_notification_read(
         notification_id=notification_id,
         current_user_id=current_user_id
     )
@@ -117,7 +120,7 @@ async def mark_all_notifications_read(
     Returns:
         Response with count of updated notifications
     """
-    return service.mark_all_read(
+    return await service.mark_all_read(
         user_id=current_user_id,
         notification_type=type
     )
@@ -144,7 +147,7 @@ async def get_unread_count(
     Returns:
         Unread count response
     """
-    return service.count_unread(
+    return await service.count_unread(
         user_id=current_user_id,
         notification_type=type
     )
@@ -185,5 +188,5 @@ async def create_notification(
     # if not is_internal_service(current_user_id):
     #     raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return service.create_notification(data)
+    return await service.create_notification(data)
 
@@ -0,0 +1,105 @@
+"""
+Keyset (cursor) pagination helpers
+
+A cursor is an opaque URL-safe token encoding the (sort key, id) pair of
+the last item on a page. The next page is selected with
+``WHERE (sort_key, id) < (:sort_key, :id)`` instead of ``OFFSET``, so with a
+matching composite index every page costs the same however deep it is.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+CursorKey = Tuple[datetime, UUID]
+
+
+def encode_cursor(sort_value: datetime, item_id: UUID) -> str:
+    """
+    Encode (sort key, id) into an opaque cursor
+
+    Args:
+        sort_value: Sort key value of the last returned item
+        item_id: ID of the last returned item
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_value.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (sort key, id)
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), UUID(item_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def keyset_condition(
+    sort_column: Any,
+    id_column: Any,
+    after: CursorKey,
+    descending: bool = True
+) -> ColumnElement[bool]:
+    """
+    Build the row-value comparison selecting items after a cursor position
+
+    Args:
+        sort_column: Column the list is ordered by
+        id_column: Primary key column used as tie-breaker
+        after: Decoded cursor (sort key, id)
+        descending: Whether the list is ordered descending
+
+    Returns:
+        SQL condition to add to the list query
+    """
+    sort_value, item_id = after
+    key = tuple_(sort_column, id_column)
+    bound = tuple_(
+        literal(sort_value, type_=sort_column.type),
+        literal(item_id, type_=id_column.type)
+    )
+    return key < bound if descending else key > bound
+
+
+def next_cursor(items: Sequence[Any], count: int, sort_attr: str) -> Optional[str]:
+    """
+    Build the cursor for the page following items
+
+    Args:
+        items: Items of the current page
+        count: Requested page size
+        sort_attr: Name of the sort key attribute on items
+
+    Returns:
+        Cursor string, or None if the page was not full (last page)
+    """
+    if not items or len(items) < count:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), last.id)
@@ -63,8 +63,10 @@ class Notification(Base):
     send_push: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     
     # Create compound index for user_id and is_read
+    # and keyset pagination index matching the list ordering
     __table_args__ = (
         Index('ix_notifications_user_id_is_read', 'user_id', 'is_read'),
+        Index('ix_notifications_user_id_created_at_id', 'user_id', 'created_at', 'id'),
     )
     
     def __repr__(self) -> str:
@@ -31,6 +31,7 @@ class NotificationsListResponse(BaseModel):
     total: int
     offset: int = 0
     count: int = 20
+    next_cursor: Optional[str] = None
     
     model_config = ConfigDict(from_attributes=True)
 
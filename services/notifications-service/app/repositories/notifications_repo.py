@@ -5,9 +5,10 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, update
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CursorKey, keyset_condition
 from app.models.db_models import Notification
 from app.models.schemas import NotificationCreateInternal
 
@@ -15,10 +16,10 @@ from app.models.schemas import NotificationCreateInternal
 class NotificationsRepository:
     """Repository for notifications"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create_notification(
+    async def create_notification(
         self,
         data: NotificationCreateInternal
     ) -> Notification:
@@ -42,11 +43,11 @@ class NotificationsRepository:
             is_read=False
         )
         self.db.add(notification)
-        self.db.commit()
-        self.db.refresh(notification)
+        await self.db.commit()
+        await self.db.refresh(notification)
         return notification
     
-    def list_notifications_for_user(
+    async def list_notifications_for_user(
         self,
         user_id: UUID,
         status: Optional[str] = "all",
@@ -54,7 +55,8 @@ class NotificationsRepository:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         offset: int = 0,
-        count: int = 20
+        count: int = 20,
+        after: Optional[CursorKey] = None
     ) -> Tuple[List[Notification], int]:
         """
         List notifications for a user with filters and pagination
@@ -67,43 +69,55 @@ class NotificationsRepository:
             date_to: Filter by created_at <= date_to (optional)
             offset: Number of records to skip
             count: Maximum number of records to return
+            after: Decoded cursor; return only records after this position
             
         Returns:
             Tuple of (notifications list, total count)
         """
-        query = self.db.query(Notification).filter(
+        query = select(Notification).where(
             Notification.user_id == user_id
         )
         
         # Apply status filter
         if status == "unread":
-            query = query.filter(Notification.is_read == False)
+            query = query.where(Notification.is_read == False)
         elif status == "read":
-            query = query.filter(Notification.is_read == True)
+            query = query.where(Notification.is_read == True)
         # "all" - no filter
         
         # Apply type filter
         if notification_type:
-            query = query.filter(Notification.type == notification_type)
+            query = query.where(Notification.type == notification_type)
         
         # Apply date filters
         if date_from:
-            query = query.filter(Notification.created_at >= date_from)
+            query = query.where(Notification.created_at >= date_from)
         
         if date_to:
-            query = query.filter(Notification.created_at <= date_to)
+            query = query.where(Notification.created_at <= date_to)
         
         # Get total count
-        total = query.count()
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
+        
+        # Keyset pagination: continue after the cursor position
+        if after:
+            query = query.where(
+                keyset_condition(Notification.created_at, Notification.id, after)
+            )
         
         # Apply pagination and order
-        notifications = query.order_by(
-            Notification.created_at.desc()
-        ).offset(offset).limit(count).all()
+        result = await self.db.execute(
+            query.order_by(
+                Notification.created_at.desc(),
+                Notification.id.desc()
+            ).offset(offset).limit(count)
+        )
         
-        return notifications, total
+        return list(result.scalars().all()), total
     
-    def get_notification(
+    async def get_notification(
         self,
         notification_id: UUID
     ) -> Optional[Notification]:
@@ -116,11 +130,12 @@ class NotificationsRepository:
         Returns:
             Notification or None if not found
         """
-        return self.db.query(Notification).filter(
-            Notification.id == notification_id
-        ).first()
+        result = await self.db.execute(
+            select(Notification).where(Notification.id == notification_id)
+        )
+        return result.scalars().first()
     
-    def mark_read(
+    async def mark_read(
         self,
         notification_id: UUID
     ) -> Optional[Notification]:
@@ -133,15 +148,15 @@ class NotificationsRepository:
         Returns:
             Updated Notification or None if not found
         """
-        notification = self.get_notification(notification_id)
+        notification = await self.get_notification(notification_id)
         if notification:
             notification.is_read = True
             notification.read_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(notification)
+            await self.db.commit()
+            await self.db.refresh(notification)
         return notification
     
-    def mark_all_read(
+    async def mark_all_read(
         self,
         user_id: UUID,
         notification_type: Optional[str] = None
@@ -173,12 +188,12 @@ class NotificationsRepository:
             read_at=datetime.utcnow()
         )
         
-        result = self.db.execute(query)
-        self.db.commit()
+        result = await self.db.execute(query)
+        await self.db.commit()
         
         return result.rowcount
     
-    def count_unread(
+    async def count_unread(
         self,
         user_id: UUID,
         notification_type: Optional[str] = None
@@ -193,7 +208,7 @@ class NotificationsRepository:
         Returns:
             Number of unread notifications
         """
-        query = self.db.query(Notification).filter(
+        query = select(func.count()).select_from(Notification).where(
             and_(
                 Notification.user_id == user_id,
                 Notification.is_read == False
@@ -201,7 +216,7 @@ class NotificationsRepository:
         )
         
         if notification_type:
-            query = query.filter(Notification.type == notification_type)
+            query = query.where(Notification.type == notification_type)
         
-        return query.count()
+        return await self.db.scalar(query)
 
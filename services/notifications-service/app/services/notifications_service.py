@@ -8,6 +8,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from app.core.pagination import decode_cursor, next_cursor
 from app.models.schemas import (
     NotificationOut,
     NotificationsListResponse,
@@ -27,7 +28,7 @@ class NotificationsService:
     def __init__(self, repo: NotificationsRepository):
         self.repo = repo
     
-    def create_notification(
+    async def create_notification(
         self,
         data: NotificationCreateInternal
     ) -> NotificationOut:
@@ -48,11 +49,11 @@ class NotificationsService:
             logger.info(f"Push notification requested for user {data.user_id}")
         
         # Create notification in database
-        notification = self.repo.create_notification(data)
+        notification = await self.repo.create_notification(data)
         
         return NotificationOut.model_validate(notification)
     
-    def list_notifications(
+    async def list_notifications(
         self,
         user_id: UUID,
         status: str = "all",
@@ -60,7 +61,8 @@ class NotificationsService:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         offset: int = 0,
-        count: int = 20
+        count: int = 20,
+        cursor: Optional[str] = None
     ) -> NotificationsListResponse:
         """
         List notifications for a user with filters
@@ -73,18 +75,23 @@ class NotificationsService:
             date_to: Filter by created_at <= date_to (optional)
             offset: Number of records to skip
             count: Maximum number of records to return
+            cursor: Opaque cursor from a previous page (optional)
             
         Returns:
             NotificationsListResponse with notifications and metadata
+            
+        Raises:
+            HTTPException: 400 if the cursor is malformed
         """
-        notifications, total = self.repo.list_notifications_for_user(
+        notifications, total = await self.repo.list_notifications_for_user(
             user_id=user_id,
             status=status,
             notification_type=notification_type,
             date_from=date_from,
             date_to=date_to,
             offset=offset,
-            count=count
+            count=count,
+            after=decode_cursor(cursor) if cursor else None
         )
         
         items = [
@@ -96,10 +103,11 @@ class NotificationsService:
             items=items,
             total=total,
             offset=offset,
-            count=count
+            count=count,
+            next_cursor=next_cursor(notifications, count, "created_at")
         )
     
-    def mark_notification_read(
+    async def mark_notification_read(
         self,
         notification_id: UUID,
         current_user_id: UUID
@@ -118,7 +126,7 @@ class NotificationsService:
             HTTPException: If notification not found or unauthorized
         """
         # Get notification
-        notification = self.repo.get_notification(notification_id)
+        notification = await self.repo.get_notification(notification_id)
         
         if not notification:
             raise HTTPException(
@@ -134,11 +142,11 @@ class NotificationsService:
             )
         
         # Mark as read
-        updated_notification = self.repo.mark_read(notification_id)
+        updated_notification = await self.repo.mark_read(notification_id)
         
         return NotificationOut.model_validate(updated_notification)
     
-    def mark_all_read(
+    async def mark_all_read(
         self,
         user_id: UUID,
         notification_type: Optional[str] = None
@@ -153,7 +161,7 @@ class NotificationsService:
         Returns:
             MarkAllReadResponse with count of updated notifications
         """
-        updated_count = self.repo.mark_all_read(
+        updated_count = await self.repo.mark_all_read(
             user_id=user_id,
             notification_type=notification_type
         )
@@ -164,7 +172,7 @@ class NotificationsService:
             type_filter=notification_type
         )
     
-    def count_unread(
+    async def count_unread(
         self,
         user_id: UUID,
         notification_type: Optional[str] = None
@@ -179,7 +187,7 @@ class NotificationsService:
         Returns:
             UnreadCountResponse with unread count
         """
-        unread_count = self.repo.count_unread(
+        unread_count = await self.repo.count_unread(
             user_id=user_id,
             notification_type=notification_type
         )
@@ -293,7 +293,43 @@ class TestNotificationsEndpoints:
         assert len(data["items"]) == 3
         assert data["offset"] == 0
         assert data["count"] == 3
-    
+
+    def test_cursor_pagination(self, client, mock_jwt_token, sample_user_id):
+        """Test keyset pagination walks all notifications without duplicates"""
+        for i in range(5):
+            client.post(
+                "/api/notifications",
+                json={
+                    "user_id": str(sample_user_id),
+                    "type": "system",
+                    "title": f"Notification {i}",
+                    "body": f"Body {i}"
+                },
+                headers={"Authorization": f"Bearer {mock_jwt_token}"}
+            )
+
+        seen = []
+        page_sizes = []
+        url = "/api/notifications/me?count=2"
+        while url:
+            response = client.get(url, headers={"Authorization": f"Bearer {mock_jwt_token}"})
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            seen.extend(item["id"] for item in data["items"])
+            page_sizes.append(len(data["items"]))
+            url = f"/api/notifications/me?count=2&cursor={data['next_cursor']}" if data["next_cursor"] else None
+
+        assert page_sizes == [2, 2, 1]
+        assert len(set(seen)) == 5
+
+    def test_invalid_cursor(self, client, mock_jwt_token):
+        """Test malformed cursor returns 400"""
+        response = client.get(
+            "/api/notifications/me?cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {mock_jwt_token}"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_unauthorized_access(self, client):
         """Test access without token returns 401"""
         response = client.get("/api/notifications/me")
@@ -2,7 +2,7 @@
 Unit tests for notifications service - testing authorization logic
 """
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from datetime import datetime
 
@@ -12,9 +12,9 @@ from app.services.notifications_service import NotificationsService
 class TestMarkNotificationRead:
     """Tests for mark_notification_read authorization"""
     
-    def test_owner_can_mark_read(self):
+    async def test_owner_can_mark_read(self):
         """Test that notification owner can mark it as read"""
-        mock_repo = Mock()
+        mock_repo = AsyncMock()
         service = NotificationsService(mock_repo)
         
         user_id = uuid4()
@@ -36,15 +36,15 @@ class TestMarkNotificationRead:
         mock_repo.mark_read.return_value = mock_notification
         
         # Should not raise
-        result = service.mark_notification_read(notification_id, user_id)
+        result = await service.mark_notification_read(notification_id, user_id)
         
-        mock_repo.mark_read.assert_called_once_with(notification_id)
+        mock_repo.mark_read.assert_awaited_once_with(notification_id)
     
-    def test_non_owner_cannot_mark_read(self):
+    async def test_non_owner_cannot_mark_read(self):
         """Test that non-owner cannot mark notification as read"""
         from fastapi import HTTPException
         
-        mock_repo = Mock()
+        mock_repo = AsyncMock()
         service = NotificationsService(mock_repo)
         
         owner_id = uuid4()
@@ -57,22 +57,22 @@ class TestMarkNotificationRead:
         mock_repo.get_notification.return_value = mock_notification
         
         with pytest.raises(HTTPException) as exc_info:
-            service.mark_notification_read(notification_id, other_user_id)
+            await service.mark_notification_read(notification_id, other_user_id)
         
         assert exc_info.value.status_code == 403
         assert "authorized" in exc_info.value.detail.lower()
     
-    def test_notification_not_found(self):
+    async def test_notification_not_found(self):
         """Test that 404 is raised when notification not found"""
         from fastapi import HTTPException
         
-        mock_repo = Mock()
+        mock_repo = AsyncMock()
         service = NotificationsService(mock_repo)
         
         mock_repo.get_notification.return_value = None
         
         with pytest.raises(HTTPException) as exc_info:
-            service.mark_notification_read(uuid4(), uuid4())
+            await service.mark_notification_read(uuid4(), uuid4())
         
         assert exc_info.value.status_code == 404
         assert "not found" in exc_info.value.detail.lower()
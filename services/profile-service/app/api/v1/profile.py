@@ -40,7 +40,7 @@ async def get_my_profile(
     Returns:
         User profile with progress statistics and achievements
     """
-    return service.get_profile(
+    return await service.get_profile(
         user_id=current_user_id,
         include_achievements=include_achievements
     )
@@ -63,7 +63,7 @@ async def update_my_profile(
     Returns:
         Updated user profile
     """
-    return service.update_profile(
+    return await service.update_profile(
         user_id=current_user_id,
         update_data=update_data
     )
@@ -108,7 +108,7 @@ async def get_user_achievements(
     # if current_user_id != user_id and not has_teacher_or_admin_role(current_user_id):
     #     raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return service.get_achievements(
+    return await service.get_achievements(
         user_id=user_id,
         code=code,
         date_from=date_from,
@@ -153,7 +153,7 @@ async def create_user_achievement(
     #     raise HTTPException(status_code=403, detail="Not enough permissions")
     
     try:
-        return service.create_achievement(
+        return await service.create_achievement(
             user_id=user_id,
             data=data,
             check_duplicate=True
@@ -201,5 +201,5 @@ async def update_user_stats(
     # if not is_internal_service(current_user_id):
     #     raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return service.update_stats(user_id=user_id, stats=stats)
+    return await service.update_stats(user_id=user_id, stats=stats)
 
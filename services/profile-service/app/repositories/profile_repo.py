@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models import UserProfile, Achievement
 from app.models.schemas import AchievementCreateRequest, UpdateStatsRequest
@@ -15,12 +15,12 @@ from app.models.schemas import AchievementCreateRequest, UpdateStatsRequest
 class ProfileRepository:
     """Repository for user profiles and achievements"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # ============= Profile Methods =============
     
-    def get_profile_by_user_id(self, user_id: UUID) -> Optional[UserProfile]:
+    async def get_profile_by_user_id(self, user_id: UUID) -> Optional[UserProfile]:
         """
         Get user profile by user_id
         
@@ -30,11 +30,12 @@ class ProfileRepository:
         Returns:
             UserProfile or None if not found
         """
-        return self.db.query(UserProfile).filter(
-            UserProfile.user_id == user_id
-        ).first()
+        result = await self.db.execute(
+            select(UserProfile).where(UserProfile.user_id == user_id)
+        )
+        return result.scalars().first()
     
-    def create_profile(self, user_id: UUID) -> UserProfile:
+    async def create_profile(self, user_id: UUID) -> UserProfile:
         """
         Create a new user profile
         
@@ -53,11 +54,11 @@ class ProfileRepository:
             tests_passed=0
         )
         self.db.add(profile)
-        self.db.commit()
-        self.db.refresh(profile)
+        await self.db.commit()
+        await self.db.refresh(profile)
         return profile
     
-    def get_or_create_profile(self, user_id: UUID) -> UserProfile:
+    async def get_or_create_profile(self, user_id: UUID) -> UserProfile:
         """
         Get existing profile or create new one
         
@@ -67,12 +68,12 @@ class ProfileRepository:
         Returns:
             UserProfile
         """
-        profile = self.get_profile_by_user_id(user_id)
+        profile = await self.get_profile_by_user_id(user_id)
         if not profile:
-            profile = self.create_profile(user_id)
+            profile = await self.create_profile(user_id)
         return profile
     
-    def update_profile(
+    async def update_profile(
         self,
         user_id: UUID,
         avatar_url: Optional[str] = None,
@@ -91,7 +92,7 @@ class ProfileRepository:
         Returns:
             Updated UserProfile or None if not found
         """
-        profile = self.get_or_create_profile(user_id)
+        profile = await self.get_or_create_profile(user_id)
         
         if avatar_url is not None:
             profile.avatar_url = avatar_url
@@ -100,11 +101,11 @@ class ProfileRepository:
         if social_links is not None:
             profile.social_links = social_links
         
-        self.db.commit()
-        self.db.refresh(profile)
+        await self.db.commit()
+        await self.db.refresh(profile)
         return profile
     
-    def update_stats(
+    async def update_stats(
         self,
         user_id: UUID,
         stats: UpdateStatsRequest
@@ -119,7 +120,7 @@ class ProfileRepository:
         Returns:
             Updated UserProfile
         """
-        profile = self.get_or_create_profile(user_id)
+        profile = await self.get_or_create_profile(user_id)
         
         # Apply deltas
         if stats.homeworks_completed_delta is not None:
@@ -141,13 +142,13 @@ class ProfileRepository:
         if stats.average_grade is not None:
             profile.average_grade = stats.average_grade
         
-        self.db.commit()
-        self.db.refresh(profile)
+        await self.db.commit()
+        await self.db.refresh(profile)
         return profile
     
     # ============= Achievement Methods =============
     
-    def list_achievements(
+    async def list_achievements(
         self,
         user_id: UUID,
         code: Optional[str] = None,
@@ -170,29 +171,33 @@ class ProfileRepository:
         Returns:
             Tuple of (achievements list, total count)
         """
-        query = self.db.query(Achievement).filter(Achievement.user_id == user_id)
+        query = select(Achievement).where(Achievement.user_id == user_id)
         
         # Apply filters
         if code:
-            query = query.filter(Achievement.code == code)
+            query = query.where(Achievement.code == code)
         
         if date_from:
-            query = query.filter(Achievement.received_at >= date_from)
+            query = query.where(Achievement.received_at >= date_from)
         
         if date_to:
-            query = query.filter(Achievement.received_at <= date_to)
+            query = query.where(Achievement.received_at <= date_to)
         
         # Get total count
-        total = query.count()
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
         
         # Apply pagination and order
-        achievements = query.order_by(
-            Achievement.received_at.desc()
-        ).offset(offset).limit(count).all()
+        result = await self.db.execute(
+            query.order_by(
+                Achievement.received_at.desc()
+            ).offset(offset).limit(count)
+        )
         
-        return achievements, total
+        return list(result.scalars().all()), total
     
-    def create_achievement(
+    async def create_achievement(
         self,
         user_id: UUID,
         data: AchievementCreateRequest
@@ -216,11 +221,11 @@ class ProfileRepository:
             received_at=data.received_at
         )
         self.db.add(achievement)
-        self.db.commit()
-        self.db.refresh(achievement)
+        await self.db.commit()
+        await self.db.refresh(achievement)
         return achievement
     
-    def achievement_exists(
+    async def achievement_exists(
         self,
         user_id: UUID,
         code: str
@@ -235,10 +240,13 @@ class ProfileRepository:
         Returns:
             True if exists, False otherwise
         """
-        return self.db.query(Achievement).filter(
-            and_(
-                Achievement.user_id == user_id,
-                Achievement.code == code
-            )
-        ).first() is not None
+        result = await self.db.execute(
+            select(Achievement.id).where(
+                and_(
+                    Achievement.user_id == user_id,
+                    Achievement.code == code
+                )
+            ).limit(1)
+        )
+        return result.first() is not None
 
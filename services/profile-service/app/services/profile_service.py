@@ -24,7 +24,7 @@ class ProfileService:
     def __init__(self, repo: ProfileRepository):
         self.repo = repo
     
-    def get_profile(
+    async def get_profile(
         self,
         user_id: UUID,
         include_achievements: bool = True,
@@ -42,7 +42,7 @@ class ProfileService:
             ProfileOut with profile data and achievements
         """
         # Get or create profile
-        profile = self.repo.get_or_create_profile(user_id)
+        profile = await self.repo.get_or_create_profile(user_id)
         
         # Prepare progress stats
         progress = ProgressStats(
@@ -57,7 +57,7 @@ class ProfileService:
         # Get achievements if requested
         achievements = None
         if include_achievements:
-            achievements_list, _ = self.repo.list_achievements(
+            achievements_list, _ = await self.repo.list_achievements(
                 user_id=user_id,
                 offset=0,
                 count=achievements_limit
@@ -77,7 +77,7 @@ class ProfileService:
             achievements=achievements
         )
     
-    def update_profile(
+    async def update_profile(
         self,
         user_id: UUID,
         update_data: ProfileUpdateRequest
@@ -93,7 +93,7 @@ class ProfileService:
             Updated ProfileOut
         """
         # Update profile
-        profile = self.repo.update_profile(
+        profile = await self.repo.update_profile(
             user_id=user_id,
             avatar_url=update_data.avatar_url,
             about=update_data.about,
@@ -101,9 +101,9 @@ class ProfileService:
         )
         
         # Return updated profile (without achievements to save performance)
-        return self.get_profile(user_id, include_achievements=False)
+        return await self.get_profile(user_id, include_achievements=False)
     
-    def get_achievements(
+    async def get_achievements(
         self,
         user_id: UUID,
         code: Optional[str] = None,
@@ -126,7 +126,7 @@ class ProfileService:
         Returns:
             AchievementsListResponse with achievements and metadata
         """
-        achievements, total = self.repo.list_achievements(
+        achievements, total = await self.repo.list_achievements(
             user_id=user_id,
             code=code,
             date_from=date_from,
@@ -148,7 +148,7 @@ class ProfileService:
             count=count
         )
     
-    def create_achievement(
+    async def create_achievement(
         self,
         user_id: UUID,
         data: AchievementCreateRequest,
@@ -169,17 +169,17 @@ class ProfileService:
             ValueError: If duplicate achievement exists and check_duplicate is True
         """
         # Check for duplicate if requested
-        if check_duplicate and self.repo.achievement_exists(user_id, data.code):
+        if check_duplicate and await self.repo.achievement_exists(user_id, data.code):
             raise ValueError(
                 f"Achievement with code '{data.code}' already exists for user {user_id}"
             )
         
         # Create achievement
-        achievement = self.repo.create_achievement(user_id, data)
+        achievement = await self.repo.create_achievement(user_id, data)
         
         return AchievementOut.model_validate(achievement)
     
-    def update_stats(
+    async def update_stats(
         self,
         user_id: UUID,
         stats: UpdateStatsRequest
@@ -195,7 +195,7 @@ class ProfileService:
             UpdateStatsResponse with updated stats
         """
         # Update statistics
-        profile = self.repo.update_stats(user_id, stats)
+        profile = await self.repo.update_stats(user_id, stats)
         
         # Prepare progress stats
         progress = ProgressStats(
@@ -2,7 +2,7 @@
 Unit tests for profile service - testing business logic
 """
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from datetime import datetime
 
@@ -12,9 +12,9 @@ from app.services.profile_service import ProfileService
 class TestCreateAchievement:
     """Tests for create_achievement duplicate checking"""
     
-    def test_create_achievement_success(self):
+    async def test_create_achievement_success(self):
         """Test successful achievement creation"""
-        mock_repo = Mock()
+        mock_repo = AsyncMock()
         service = ProfileService(mock_repo)
         
         user_id = uuid4()
@@ -40,13 +40,13 @@ class TestCreateAchievement:
             received_at=datetime.utcnow()
         )
         
-        result = service.create_achievement(user_id, data, check_duplicate=True)
+        result = await service.create_achievement(user_id, data, check_duplicate=True)
         
-        mock_repo.create_achievement.assert_called_once()
+        mock_repo.create_achievement.assert_awaited_once()
     
-    def test_create_achievement_duplicate_raises_error(self):
+    async def test_create_achievement_duplicate_raises_error(self):
         """Test that duplicate achievement raises ValueError"""
-        mock_repo = Mock()
+        mock_repo = AsyncMock()
         service = ProfileService(mock_repo)
         
         user_id = uuid4()
@@ -63,13 +63,13 @@ class TestCreateAchievement:
         )
         
         with pytest.raises(ValueError) as exc_info:
-            service.create_achievement(user_id, data, check_duplicate=True)
+            await service.create_achievement(user_id, data, check_duplicate=True)
         
         assert "already exists" in str(exc_info.value)
     
-    def test_create_achievement_skip_duplicate_check(self):
+    async def test_create_achievement_skip_duplicate_check(self):
         """Test that duplicate check can be skipped"""
-        mock_repo = Mock()
+        mock_repo = AsyncMock()
         service = ProfileService(mock_repo)
         
         user_id = uuid4()
@@ -93,7 +93,7 @@ class TestCreateAchievement:
         )
         
         # Should not check for duplicate
-        result = service.create_achievement(user_id, data, check_duplicate=False)
+        result = await service.create_achievement(user_id, data, check_duplicate=False)
         
-        mock_repo.achievement_exists.assert_not_called()
-        mock_repo.create_achievement.assert_called_once()
+        mock_repo.achievement_exists.assert_not_awaited()
+        mock_repo.create_achievement.assert_awaited_once()
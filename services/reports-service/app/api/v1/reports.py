@@ -48,7 +48,7 @@ async def generate_report(
     # Check permissions
     require_role(["teacher", "admin", "manager"], user_role)
     
-    return service.start_generation(request, user_id)
+    return await service.start_generation(request, user_id)
 
 
 @router.get(
@@ -70,7 +70,7 @@ async def get_operation_status(
     
     - **operation_id**: UUID of the operation
     """
-    return service.get_operation_status(operation_id, user_id, user_role)
+    return await service.get_operation_status(operation_id, user_id, user_role)
 
 
 # ============================================================================
@@ -110,7 +110,7 @@ async def list_reports(
     # Check permissions
     require_role(["teacher", "admin", "manager"], user_role)
     
-    items, total = service.list_reports(
+    items, total = await service.list_reports(
         type=type,
         format=format,
         status=status,
@@ -147,7 +147,7 @@ async def get_report(
     
     - **report_id**: UUID of the report
     """
-    return service.get_report(report_id, user_id, user_role)
+    return await service.get_report(report_id, user_id, user_role)
 
 
 @router.get(
@@ -169,7 +169,7 @@ async def get_download_link(
     
     - **report_id**: UUID of the report
     """
-    return service.get_download_link(report_id, user_id, user_role)
+    return await service.get_download_link(report_id, user_id, user_role)
 
 
 @router.post(
@@ -192,5 +192,5 @@ async def regenerate_report(
     
     - **report_id**: UUID of the report to regenerate
     """
-    return service.regenerate_report(report_id, user_id, user_role)
+    return await service.regenerate_report(report_id, user_id, user_role)
 
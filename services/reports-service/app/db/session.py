@@ -1,50 +1,56 @@
 """
 Database session management
 """
-from typing import Generator
+from typing import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
 
 
 settings = get_settings()
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
+# Create async SQLAlchemy engine (asyncpg driver), so database I/O
+# never blocks the event loop serving the async endpoints
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using them
     echo=settings.is_development,  # Log SQL in development
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(
-    autocommit=False,
+# Create AsyncSessionLocal class
+# expire_on_commit=False: attributes cannot be lazily reloaded on AsyncSession
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False
 )
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session
     
     Yields:
-        Database session
+        Async database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """
     Initialize database - create all tables
     Should be called on application startup
     """
     from app.models.db_models import Base
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
+
+async def close_db() -> None:
+    """
+    Dispose the connection pool
+    Should be called on application shutdown
+    """
+    await engine.dispose()
@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models import ReportOperation, Report
 
@@ -14,14 +14,14 @@ from app.models.db_models import ReportOperation, Report
 class ReportsRepository:
     """Repository for managing reports and operations"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # ========================================================================
     # Operation methods
     # ========================================================================
     
-    def create_operation(
+    async def create_operation(
         self,
         type: str,
         format: str,
@@ -49,11 +49,11 @@ class ReportsRepository:
             requested_at=datetime.utcnow()
         )
         self.db.add(operation)
-        self.db.commit()
-        self.db.refresh(operation)
+        await self.db.commit()
+        await self.db.refresh(operation)
         return operation
     
-    def set_operation_started(self, operation_id: UUID) -> Optional[ReportOperation]:
+    async def set_operation_started(self, operation_id: UUID) -> Optional[ReportOperation]:
         """
         Mark operation as started
         
@@ -63,7 +63,7 @@ class ReportsRepository:
         Returns:
             Updated operation or None
         """
-        operation = self.get_operation(operation_id)
+        operation = await self.get_operation(operation_id)
         if not operation:
             return None
         
@@ -71,11 +71,11 @@ class ReportsRepository:
         operation.started_at = datetime.utcnow()
         operation.progress_percent = 0
         
-        self.db.commit()
-        self.db.refresh(operation)
+        await self.db.commit()
+        await self.db.refresh(operation)
         return operation
     
-    def set_operation_progress(
+    async def set_operation_progress(
         self,
         operation_id: UUID,
         progress_percent: int
@@ -90,17 +90,17 @@ class ReportsRepository:
         Returns:
             Updated operation or None
         """
-        operation = self.get_operation(operation_id)
+        operation = await self.get_operation(operation_id)
         if not operation:
             return None
         
         operation.progress_percent = max(0, min(100, progress_percent))
         
-        self.db.commit()
-        self.db.refresh(operation)
+        await self.db.commit()
+        await self.db.refresh(operation)
         return operation
     
-    def set_operation_completed(
+    async def set_operation_completed(
         self,
         operation_id: UUID,
         report_id: UUID
@@ -115,7 +115,7 @@ class ReportsRepository:
         Returns:
             Updated operation or None
         """
-        operation = self.get_operation(operation_id)
+        operation = await self.get_operation(operation_id)
         if not operation:
             return None
         
@@ -124,11 +124,11 @@ class ReportsRepository:
         operation.progress_percent = 100
         operation.report_id = report_id
         
-        self.db.commit()
-        self.db.refresh(operation)
+        await self.db.commit()
+        await self.db.refresh(operation)
         return operation
     
-    def set_operation_failed(
+    async def set_operation_failed(
         self,
         operation_id: UUID,
         error_message: str
@@ -143,7 +143,7 @@ class ReportsRepository:
         Returns:
             Updated operation or None
         """
-        operation = self.get_operation(operation_id)
+        operation = await self.get_operation(operation_id)
         if not operation:
             return None
         
@@ -151,11 +151,11 @@ class ReportsRepository:
         operation.finished_at = datetime.utcnow()
         operation.error_message = error_message
         
-        self.db.commit()
-        self.db.refresh(operation)
+        await self.db.commit()
+        await self.db.refresh(operation)
         return operation
     
-    def get_operation(self, operation_id: UUID) -> Optional[ReportOperation]:
+    async def get_operation(self, operation_id: UUID) -> Optional[ReportOperation]:
         """
         Get operation by ID
         
@@ -165,15 +165,16 @@ class ReportsRepository:
         Returns:
             Operation or None
         """
-        return self.db.query(ReportOperation).filter(
-            ReportOperation.id == operation_id
-        ).first()
+        result = await self.db.execute(
+            select(ReportOperation).where(ReportOperation.id == operation_id)
+        )
+        return result.scalars().first()
     
     # ========================================================================
     # Report methods
     # ========================================================================
     
-    def create_report(
+    async def create_report(
         self,
         type: str,
         format: str,
@@ -211,11 +212,11 @@ class ReportsRepository:
             ready_at=datetime.utcnow()
         )
         self.db.add(report)
-        self.db.commit()
-        self.db.refresh(report)
+        await self.db.commit()
+        await self.db.refresh(report)
         return report
     
-    def get_report(self, report_id: UUID) -> Optional[Report]:
+    async def get_report(self, report_id: UUID) -> Optional[Report]:
         """
         Get report by ID
         
@@ -225,9 +226,10 @@ class ReportsRepository:
         Returns:
             Report or None
         """
-        return self.db.query(Report).filter(Report.id == report_id).first()
+        result = await self.db.execute(select(Report).where(Report.id == report_id))
+        return result.scalars().first()
     
-    def list_reports(
+    async def list_reports(
         self,
         type: Optional[str] = None,
         format: Optional[str] = None,
@@ -254,34 +256,38 @@ class ReportsRepository:
         Returns:
             Tuple of (reports list, total count)
         """
-        query = self.db.query(Report)
+        query = select(Report)
         
         # Apply filters
         if type:
-            query = query.filter(Report.type == type)
+            query = query.where(Report.type == type)
         if format:
-            query = query.filter(Report.format == format)
+            query = query.where(Report.format == format)
         if status:
             if status == "all":
                 pass  # No filter
             else:
-                query = query.filter(Report.status == status)
+                query = query.where(Report.status == status)
         else:
             # Default: only completed
-            query = query.filter(Report.status == "completed")
+            query = query.where(Report.status == "completed")
         
         if created_by:
-            query = query.filter(Report.created_by == created_by)
+            query = query.where(Report.created_by == created_by)
         if from_date:
-            query = query.filter(Report.created_at >= from_date)
+            query = query.where(Report.created_at >= from_date)
         if to_date:
-            query = query.filter(Report.created_at <= to_date)
+            query = query.where(Report.created_at <= to_date)
         
         # Get total
-        total = query.count()
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
         
         # Get paginated results
-        reports = query.order_by(Report.created_at.desc()).offset(offset).limit(count).all()
+        result = await self.db.execute(
+            query.order_by(Report.created_at.desc()).offset(offset).limit(count)
+        )
         
-        return reports, total
+        return list(result.scalars().all()), total
 
@@ -122,7 +122,7 @@ In production, this would contain actual report data.
     # Main service methods
     # ========================================================================
     
-    def start_generation(
+    async def start_generation(
         self,
         request: ReportGenerateRequest,
         requested_by: str
@@ -147,7 +147,7 @@ In production, this would contain actual report data.
             )
         
         # Create operation
-        operation = self.repo.create_operation(
+        operation = await self.repo.create_operation(
             type=request.type,
             format=request.format,
             filters_json=filters_dict,
@@ -157,7 +157,7 @@ In production, this would contain actual report data.
         # Start generation (synchronous for simplicity)
         try:
             # Mark as started
-            self.repo.set_operation_started(operation.id)
+            await self.repo.set_operation_started(operation.id)
             
             # Generate file
             file_path = self._generate_file_path(uuid.uuid4(), request.format)
@@ -172,7 +172,7 @@ In production, this would contain actual report data.
             download_url = self._build_download_url(file_path)
             
             # Create report record
-            report = self.repo.create_report(
+            report = await self.repo.create_report(
                 type=request.type,
                 format=request.format,
                 filters_json=filters_dict,
@@ -183,19 +183,19 @@ In production, this would contain actual report data.
             )
             
             # Mark operation as completed
-            self.repo.set_operation_completed(operation.id, report.id)
+            await self.repo.set_operation_completed(operation.id, report.id)
             
             # Get updated operation
-            operation = self.repo.get_operation(operation.id)
+            operation = await self.repo.get_operation(operation.id)
             
         except Exception as e:
             # Mark as failed
-            self.repo.set_operation_failed(operation.id, str(e))
-            operation = self.repo.get_operation(operation.id)
+            await self.repo.set_operation_failed(operation.id, str(e))
+            operation = await self.repo.get_operation(operation.id)
         
         return ReportOperationOut.model_validate(operation)
     
-    def get_operation_status(
+    async def get_operation_status(
         self,
         operation_id: UUID,
         user_id: str,
@@ -215,7 +215,7 @@ In production, this would contain actual report data.
         Raises:
             HTTPException: If operation not found or access denied
         """
-        operation = self.repo.get_operation(operation_id)
+        operation = await self.repo.get_operation(operation_id)
         if not operation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -231,7 +231,7 @@ In production, this would contain actual report data.
         
         return ReportOperationOut.model_validate(operation)
     
-    def list_reports(
+    async def list_reports(
         self,
         type: Optional[str] = None,
         format: Optional[str] = None,
@@ -258,7 +258,7 @@ In production, this would contain actual report data.
         Returns:
             Tuple of (report items, total count)
         """
-        reports, total = self.repo.list_reports(
+        reports, total = await self.repo.list_reports(
             type=type,
             format=format,
             status=status,
@@ -272,7 +272,7 @@ In production, this would contain actual report data.
         items = [ReportListItem.model_validate(r) for r in reports]
         return items, total
     
-    def get_report(
+    async def get_report(
         self,
         report_id: UUID,
         user_id: str,
@@ -292,7 +292,7 @@ In production, this would contain actual report data.
         Raises:
             HTTPException: If report not found or access denied
         """
-        report = self.repo.get_report(report_id)
+        report = await self.repo.get_report(report_id)
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -308,7 +308,7 @@ In production, this would contain actual report data.
         
         return ReportOut.model_validate(report)
     
-    def get_download_link(
+    async def get_download_link(
         self,
         report_id: UUID,
         user_id: str,
@@ -328,7 +328,7 @@ In production, this would contain actual report data.
         Raises:
             HTTPException: If report not found or access denied
         """
-        report = self.repo.get_report(report_id)
+        report = await self.repo.get_report(report_id)
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -357,7 +357,7 @@ In production, this would contain actual report data.
             expires_at=expires_at
         )
     
-    def regenerate_report(
+    async def regenerate_report(
         self,
         report_id: UUID,
         requested_by: str,
@@ -378,7 +378,7 @@ In production, this would contain actual report data.
             HTTPException: If report not found or access denied
         """
         # Get original report
-        report = self.repo.get_report(report_id)
+        report = await self.repo.get_report(report_id)
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -400,5 +400,5 @@ In production, this would contain actual report data.
         )
         
         # Start new generation
-        return self.start_generation(request, requested_by)
+        return await self.start_generation(request, requested_by)
 
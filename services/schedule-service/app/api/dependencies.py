@@ -4,7 +4,7 @@ API dependencies
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.repositories.schedule_repo import ScheduleRepository
@@ -13,7 +13,7 @@ from app.core.security import get_current_user_id, get_current_user_role
 
 
 # Database dependency
-DbSession = Annotated[Session, Depends(get_db)]
+DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 # User authentication dependencies
 CurrentUserId = Annotated[str, Depends(get_current_user_id)]
@@ -41,7 +41,7 @@ async def create_lesson(
     - **course_id**: UUID of the course
     - **data**: Lesson creation data
     """
-    return service.create_lesson(course_id, data, user_role)
+    return await service.create_lesson(course_id, data, user_role)
 
 
 @router.patch(
@@ -62,7 +62,7 @@ async def update_lesson(
     - **lesson_id**: UUID of the lesson
     - **data**: Lesson update data (all fields optional)
     """
-    return service.update_lesson(lesson_id, data, user_role)
+    return await service.update_lesson(lesson_id, data, user_role)
 
 
 @router.get(
@@ -80,7 +80,7 @@ async def get_lesson(
     
     - **lesson_id**: UUID of the lesson
     """
-    return service.get_lesson(lesson_id)
+    return await service.get_lesson(lesson_id)
 
 
 # ============================================================================
@@ -116,7 +116,7 @@ async def get_my_schedule(
     # For now, using empty list - would need to be integrated with other services
     course_ids = []  # Would call enrollment/course service here
     
-    items, total = service.get_user_schedule(
+    items, total = await service.get_user_schedule(
         UUID(user_id),
         user_role,
         course_ids,
@@ -153,7 +153,7 @@ async def get_course_schedule(
     - **date_from**: Optional start date filter
     - **date_to**: Optional end date filter
     """
-    lessons = service.get_course_schedule(course_id, date_from, date_to)
+    lessons = await service.get_course_schedule(course_id, date_from, date_to)
     
     return CourseScheduleResponse(
         course_id=course_id,
@@ -186,7 +186,7 @@ async def set_attendance(
     - **lesson_id**: UUID of the lesson
     - **data**: Attendance data for students
     """
-    items, updated_at = service.set_attendance(lesson_id, data.items, user_role)
+    items, updated_at = await service.set_attendance(lesson_id, data.items, user_role)
     
     return AttendanceSetResponse(
         lesson_id=lesson_id,
@@ -216,10 +216,10 @@ async def get_attendance(
     - **lesson_id**: UUID of the lesson
     """
     # Get lesson to include in response
-    lesson = service.get_lesson(lesson_id)
+    lesson = await service.get_lesson(lesson_id)
     
     # Get attendance items
-    items = service.get_attendance(lesson_id, UUID(user_id), user_role)
+    items = await service.get_attendance(lesson_id, UUID(user_id), user_role)
     
     return AttendanceResponse(
         lesson_id=lesson_id,
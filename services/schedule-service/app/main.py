@@ -11,7 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
 from app.core.logging_config import setup_logging, get_logger
 from app.core.metrics import setup_metrics
-from app.db.session import init_db
+from app.db.session import init_db, close_db
 from app.api.v1 import schedule
 
 
@@ -36,11 +36,12 @@ async def lifespan(app: FastAPI):
         "version": settings.APP_VERSION,
         "environment": settings.ENV
     })
-    init_db()
+    await init_db()
     logger.info("Database initialized")
     yield
     # Shutdown
     logger.info("Shutting down Schedule Service")
+    await close_db()
 
 
 # Create FastAPI application
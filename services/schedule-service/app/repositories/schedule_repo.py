@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models import Lesson, LessonAttendance
 from app.models.schemas import LessonCreate, LessonUpdate, AttendanceItemUpdate
@@ -15,14 +15,14 @@ from app.models.schemas import LessonCreate, LessonUpdate, AttendanceItemUpdate
 class ScheduleRepository:
     """Repository for managing lessons and attendance"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # ========================================================================
     # Lesson methods
     # ========================================================================
     
-    def create_lesson(self, course_id: UUID, data: LessonCreate) -> Lesson:
+    async def create_lesson(self, course_id: UUID, data: LessonCreate) -> Lesson:
         """
         Create a new lesson
         
@@ -45,11 +45,11 @@ class ScheduleRepository:
             status="scheduled"
         )
         self.db.add(lesson)
-        self.db.commit()
-        self.db.refresh(lesson)
+        await self.db.commit()
+        await self.db.refresh(lesson)
         return lesson
     
-    def get_lesson(self, lesson_id: UUID) -> Optional[Lesson]:
+    async def get_lesson(self, lesson_id: UUID) -> Optional[Lesson]:
         """
         Get lesson by ID
         
@@ -59,9 +59,10 @@ class ScheduleRepository:
         Returns:
             Lesson or None if not found
         """
-        return self.db.query(Lesson).filter(Lesson.id == lesson_id).first()
+        result = await self.db.execute(select(Lesson).where(Lesson.id == lesson_id))
+        return result.scalars().first()
     
-    def update_lesson(self, lesson_id: UUID, data: LessonUpdate) -> Optional[Lesson]:
+    async def update_lesson(self, lesson_id: UUID, data: LessonUpdate) -> Optional[Lesson]:
         """
         Update lesson
         
@@ -72,7 +73,7 @@ class ScheduleRepository:
         Returns:
             Updated lesson or None if not found
         """
-        lesson = self.get_lesson(lesson_id)
+        lesson = await self.get_lesson(lesson_id)
         if not lesson:
             return None
         
@@ -81,11 +82,11 @@ class ScheduleRepository:
         for field, value in update_data.items():
             setattr(lesson, field, value)
         
-        self.db.commit()
-        self.db.refresh(lesson)
+        await self.db.commit()
+        await self.db.refresh(lesson)
         return lesson
     
-    def list_lessons_for_course(
+    async def list_lessons_for_course(
         self,
         course_id: UUID,
         date_from: Optional[datetime] = None,
@@ -102,16 +103,17 @@ class ScheduleRepository:
         Returns:
             List of lessons
         """
-        query = self.db.query(Lesson).filter(Lesson.course_id == course_id)
+        query = select(Lesson).where(Lesson.course_id == course_id)
         
         if date_from:
-            query = query.filter(Lesson.start_at >= date_from)
+            query = query.where(Lesson.start_at >= date_from)
         if date_to:
-            query = query.filter(Lesson.start_at <= date_to)
+            query = query.where(Lesson.start_at <= date_to)
         
-        return query.order_by(Lesson.start_at).all()
+        result = await self.db.execute(query.order_by(Lesson.start_at))
+        return list(result.scalars().all())
     
-    def list_lessons_for_user(
+    async def list_lessons_for_user(
         self,
         course_ids: list[UUID],
         date_from: Optional[datetime] = None,
@@ -132,23 +134,27 @@ class ScheduleRepository:
         Returns:
             Tuple of (lessons list, total count)
         """
-        query = self.db.query(Lesson).filter(Lesson.course_id.in_(course_ids))
+        query = select(Lesson).where(Lesson.course_id.in_(course_ids))
         
         if date_from:
-            query = query.filter(Lesson.start_at >= date_from)
+            query = query.where(Lesson.start_at >= date_from)
         if date_to:
-            query = query.filter(Lesson.start_at <= date_to)
+            query = query.where(Lesson.start_at <= date_to)
         
-        total = query.count()
-        lessons = query.order_by(Lesson.start_at).offset(offset).limit(count).all()
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
+        result = await self.db.execute(
+            query.order_by(Lesson.start_at).offset(offset).limit(count)
+        )
         
-        return lessons, total
+        return list(result.scalars().all()), total
     
     # ========================================================================
     # Attendance methods
     # ========================================================================
     
-    def set_attendance(
+    async def set_attendance(
         self,
         lesson_id: UUID,
         items: list[AttendanceItemUpdate]
@@ -169,12 +175,7 @@ class ScheduleRepository:
         
         for item in items:
             # Try to find existing attendance record
-            attendance = self.db.query(LessonAttendance).filter(
-                and_(
-                    LessonAttendance.lesson_id == lesson_id,
-                    LessonAttendance.student_id == item.student_id
-                )
-            ).first()
+            attendance = await self.get_student_attendance(lesson_id, item.student_id)
             
             if attendance:
                 # Update existing record
@@ -194,15 +195,15 @@ class ScheduleRepository:
             
             result.append(attendance)
         
-        self.db.commit()
+        await self.db.commit()
         
         # Refresh all records
         for attendance in result:
-            self.db.refresh(attendance)
+            await self.db.refresh(attendance)
         
         return result
     
-    def get_attendance(self, lesson_id: UUID) -> list[LessonAttendance]:
+    async def get_attendance(self, lesson_id: UUID) -> list[LessonAttendance]:
         """
         Get all attendance records for a lesson
         
@@ -212,11 +213,12 @@ class ScheduleRepository:
         Returns:
             List of attendance records
         """
-        return self.db.query(LessonAttendance).filter(
-            LessonAttendance.lesson_id == lesson_id
-        ).all()
+        result = await self.db.execute(
+            select(LessonAttendance).where(LessonAttendance.lesson_id == lesson_id)
+        )
+        return list(result.scalars().all())
     
-    def get_student_attendance(
+    async def get_student_attendance(
         self,
         lesson_id: UUID,
         student_id: UUID
@@ -231,10 +233,13 @@ class ScheduleRepository:
         Returns:
             Attendance record or None
         """
-        return self.db.query(LessonAttendance).filter(
-            and_(
-                LessonAttendance.lesson_id == lesson_id,
-                LessonAttendance.student_id == student_id
+        result = await self.db.execute(
+            select(LessonAttendance).where(
+                and_(
+                    LessonAttendance.lesson_id == lesson_id,
+                    LessonAttendance.student_id == student_id
+                )
             )
-        ).first()
+        )
+        return result.scalars().first()
 
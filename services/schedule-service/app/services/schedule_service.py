@@ -61,7 +61,7 @@ class ScheduleService:
     # Lesson methods
     # ========================================================================
     
-    def create_lesson(
+    async def create_lesson(
         self,
         course_id: UUID,
         data: LessonCreate,
@@ -88,10 +88,10 @@ class ScheduleService:
         self._validate_dates(data.start_at, data.end_at)
         
         # Create lesson
-        lesson = self.repo.create_lesson(course_id, data)
+        lesson = await self.repo.create_lesson(course_id, data)
         return LessonOut.model_validate(lesson)
     
-    def update_lesson(
+    async def update_lesson(
         self,
         lesson_id: UUID,
         data: LessonUpdate,
@@ -115,7 +115,7 @@ class ScheduleService:
         self._check_teacher_or_admin(user_role)
         
         # Get existing lesson
-        lesson = self.repo.get_lesson(lesson_id)
+        lesson = await self.repo.get_lesson(lesson_id)
         if not lesson:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -138,10 +138,10 @@ class ScheduleService:
             )
         
         # Update lesson
-        updated_lesson = self.repo.update_lesson(lesson_id, data)
+        updated_lesson = await self.repo.update_lesson(lesson_id, data)
         return LessonOut.model_validate(updated_lesson)
     
-    def get_lesson(self, lesson_id: UUID) -> LessonOut:
+    async def get_lesson(self, lesson_id: UUID) -> LessonOut:
         """
         Get lesson by ID
         
@@ -154,7 +154,7 @@ class ScheduleService:
         Raises:
             HTTPException: If lesson not found
         """
-        lesson = self.repo.get_lesson(lesson_id)
+        lesson = await self.repo.get_lesson(lesson_id)
         if not lesson:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -166,7 +166,7 @@ class ScheduleService:
     # Schedule methods
     # ========================================================================
     
-    def get_user_schedule(
+    async def get_user_schedule(
         self,
         user_id: UUID,
         user_role: str,
@@ -194,7 +194,7 @@ class ScheduleService:
         if not course_ids:
             return [], 0
         
-        lessons, total = self.repo.list_lessons_for_user(
+        lessons, total = await self.repo.list_lessons_for_user(
             course_ids, date_from, date_to, offset, count
         )
         
@@ -218,7 +218,7 @@ class ScheduleService:
         
         return items, total
     
-    def get_course_schedule(
+    async def get_course_schedule(
         self,
         course_id: UUID,
         date_from: Optional[datetime] = None,
@@ -235,14 +235,14 @@ class ScheduleService:
         Returns:
             List of lessons
         """
-        lessons = self.repo.list_lessons_for_course(course_id, date_from, date_to)
+        lessons = await self.repo.list_lessons_for_course(course_id, date_from, date_to)
         return [LessonOut.model_validate(lesson) for lesson in lessons]
     
     # ========================================================================
     # Attendance methods
     # ========================================================================
     
-    def set_attendance(
+    async def set_attendance(
         self,
         lesson_id: UUID,
         items: list[AttendanceItemUpdate],
@@ -266,7 +266,7 @@ class ScheduleService:
         self._check_teacher_or_admin(user_role)
         
         # Verify lesson exists
-        lesson = self.repo.get_lesson(lesson_id)
+        lesson = await self.repo.get_lesson(lesson_id)
         if not lesson:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -275,7 +275,7 @@ class ScheduleService:
         
         # Set attendance
         now = datetime.utcnow()
-        attendance_records = self.repo.set_attendance(lesson_id, items)
+        attendance_records = await self.repo.set_attendance(lesson_id, items)
         
         # Convert to response schema
         result = [
@@ -291,7 +291,7 @@ class ScheduleService:
         
         return result, now
     
-    def get_attendance(
+    async def get_attendance(
         self,
         lesson_id: UUID,
         user_id: UUID,
@@ -312,7 +312,7 @@ class ScheduleService:
             HTTPException: If lesson not found
         """
         # Verify lesson exists
-        lesson = self.repo.get_lesson(lesson_id)
+        lesson = await self.repo.get_lesson(lesson_id)
         if not lesson:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -322,10 +322,10 @@ class ScheduleService:
         # Get attendance
         if user_role in ["teacher", "admin"]:
             # Teachers and admins can see all attendance
-            attendance_records = self.repo.get_attendance(lesson_id)
+            attendance_records = await self.repo.get_attendance(lesson_id)
         else:
             # Students can only see their own attendance
-            attendance_record = self.repo.get_student_attendance(lesson_id, user_id)
+            attendance_record = await self.repo.get_student_attendance(lesson_id, user_id)
             attendance_records = [attendance_record] if attendance_record else []
         
         # Convert to response schema
@@ -0,0 +1,171 @@
+"""
+Concurrency benchmark: async data access vs. blocking sync sessions
+
+Fires N concurrent requests at two equivalent course schedule handlers and
+measures request latency together with event loop lag (how late a 10 ms
+ticker wakes up while the burst is running). With a blocking handler (sync
+SQLAlchemy inside ``async def``, the pre-AsyncSession pattern) every query
+stalls the event loop, so health checks and all other requests queue
+behind it. With AsyncSession the loop stays responsive.
+
+SQLite/aiosqlite is used as a local stand-in; absolute numbers against
+PostgreSQL/asyncpg will differ, the loop lag comparison is the point.
+
+Usage (from the service directory):
+    python -m benchmarks.bench_concurrency --requests 200 --lessons 10000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.db_models import Base, Lesson
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values (nearest rank)"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def seed_database(db_url: str, lessons: int, courses: int) -> list[uuid.UUID]:
+    """Create tables and insert lessons spread over several courses"""
+    engine = create_engine(db_url)
+    Base.metadata.create_all(bind=engine)
+    course_ids = [uuid.uuid4() for _ in range(courses)]
+    start = datetime(2025, 9, 1, 9, 0)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "course_id": course_ids[i % courses],
+            "title": f"Lesson {i}",
+            "start_at": start + timedelta(hours=i),
+            "end_at": start + timedelta(hours=i, minutes=90),
+            "location_type": "online",
+            "status": "scheduled",
+        }
+        for i in range(lessons)
+    ]
+    with engine.begin() as conn:
+        conn.execute(Lesson.__table__.insert(), rows)
+    engine.dispose()
+    return course_ids
+
+
+def build_app(sync_url: str, async_url: str) -> FastAPI:
+    """Build an app exposing the same query through both session types"""
+    app = FastAPI()
+    
+    async_engine = create_async_engine(async_url)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    
+    @app.get("/async/courses/{course_id}/schedule")
+    async def async_course_schedule(course_id: uuid.UUID):
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Lesson).where(Lesson.course_id == course_id).order_by(Lesson.start_at)
+            )
+            return {"count": len(result.scalars().all())}
+    
+    sync_engine = create_engine(sync_url, connect_args={"check_same_thread": False})
+    SyncSessionLocal = sessionmaker(bind=sync_engine)
+    
+    @app.get("/blocking/courses/{course_id}/schedule")
+    async def blocking_course_schedule(course_id: uuid.UUID):
+        # The pre-async pattern: a sync session used inside an async handler
+        with SyncSessionLocal() as db:
+            lessons = db.execute(
+                select(Lesson).where(Lesson.course_id == course_id).order_by(Lesson.start_at)
+            ).scalars().all()
+            return {"count": len(lessons)}
+    
+    app.state.engines = (async_engine, sync_engine)
+    return app
+
+
+async def run_burst(app: FastAPI, path_template: str, course_ids: list, requests: int) -> dict:
+    """Send a burst of concurrent requests while sampling event loop lag"""
+    transport = httpx.ASGITransport(app=app)
+    lags: list[float] = []
+    done = asyncio.Event()
+    
+    async def ticker() -> None:
+        interval = 0.01
+        while not done.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lags.append(max(0.0, (time.perf_counter() - expected) * 1000))
+    
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def timed(url: str) -> float:
+            # Latency is measured from the start of the burst, i.e. as seen by
+            # a client whose request arrived together with all the others
+            response = await client.get(url)
+            response.raise_for_status()
+            return (time.perf_counter() - started) * 1000
+        
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*[
+            timed(path_template.format(course_id=course_ids[i % len(course_ids)]))
+            for i in range(requests)
+        ])
+        wall_ms = (time.perf_counter() - started) * 1000
+        done.set()
+        await ticker_task
+    
+    return {
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 99),
+        "lag_max": max(lags) if lags else 0.0,
+        "wall": wall_ms,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--lessons", type=int, default=10000)
+    parser.add_argument("--courses", type=int, default=200)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "bench.db")
+        sync_url = f"sqlite:///{db_path}"
+        async_url = f"sqlite+aiosqlite:///{db_path}"
+        course_ids = seed_database(sync_url, args.lessons, args.courses)
+        app = build_app(sync_url, async_url)
+        
+        print(f"{args.requests} concurrent requests, {args.lessons} lessons in {args.courses} courses")
+        print(f"{'mode':<10}{'p50 ms':>10}{'p99 ms':>10}{'max loop lag ms':>18}{'wall ms':>10}")
+        for mode, path in (
+            ("blocking", "/blocking/courses/{course_id}/schedule"),
+            ("async", "/async/courses/{course_id}/schedule"),
+        ):
+            # Warm up connections and caches before measuring
+            await run_burst(app, path, course_ids, min(20, args.requests))
+            result = await run_burst(app, path, course_ids, args.requests)
+            print(
+                f"{mode:<10}{result['p50']:>10.1f}{result['p99']:>10.1f}"
+                f"{result['lag_max']:>18.1f}{result['wall']:>10.1f}"
+            )
+        
+        async_engine, sync_engine = app.state.engines
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,8 +4,7 @@ Test configuration and fixtures
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.db.session import get_db
@@ -14,31 +13,32 @@ from app.api.v1 import schedule
 from app.core.config import get_settings
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-engine = create_engine(
+engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
-@pytest.fixture
-def db_session():
-    """Create a fresh database session for each test"""
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
+async def create_tables():
+    """Create all tables in the in-memory database"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def drop_tables():
+    """Drop all tables and release the connection bound to the test event loop"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
 
 
 @pytest.fixture
-def client(db_session):
+def client():
     """Create a test client with overridden database dependency"""
     settings = get_settings()
     test_app = FastAPI(
@@ -55,16 +55,19 @@ def client(db_session):
     def health_check():
         return {"status": "healthy", "service": settings.APP_NAME}
     
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def override_get_db():
+        async with TestingSessionLocal() as session:
+            yield session
     
     test_app.dependency_overrides[get_db] = override_get_db
     
+    # Tables are created on the client's event loop, which aiosqlite binds to
     with TestClient(test_app) as test_client:
-        yield test_client
+        test_client.portal.call(create_tables)
+        try:
+            yield test_client
+        finally:
+            test_client.portal.call(drop_tables)
     
     test_app.dependency_overrides.clear()
 
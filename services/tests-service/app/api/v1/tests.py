@@ -31,7 +31,7 @@ async def create_test(
 ) -> TestOut:
     """Create a new test (teachers only)"""
     # In production: check if user is a teacher for this course
-    return service.create_test(course_id, data)
+    return await service.create_test(course_id, data)
 
 
 @router.post(
@@ -46,7 +46,7 @@ async def publish_test(
     current_user_id: Annotated[UUID, Depends(get_current_user_id)]
 ) -> TestOut:
     """Publish a test (teachers only)"""
-    return service.publish_test(test_id, data)
+    return await service.publish_test(test_id, data)
 
 
 @router.post(
@@ -60,7 +60,7 @@ async def start_attempt(
     current_user_id: Annotated[UUID, Depends(get_current_user_id)]
 ) -> TestAttemptStartResponse:
     """Start a new test attempt (students)"""
-    return service.start_attempt(test_id, current_user_id)
+    return await service.start_attempt(test_id, current_user_id)
 
 
 @router.post(
@@ -76,7 +76,7 @@ async def submit_attempt(
     current_user_id: Annotated[UUID, Depends(get_current_user_id)]
 ) -> AttemptResult:
     """Submit attempt answers and get results"""
-    return service.submit_attempt(test_id, attempt_id, data, current_user_id)
+    return await service.submit_attempt(test_id, attempt_id, data, current_user_id)
 
 
 @router.get(
@@ -91,7 +91,7 @@ async def get_attempt_result(
     current_user_id: Annotated[UUID, Depends(get_current_user_id)]
 ) -> AttemptResult:
     """Get attempt result"""
-    return service.get_attempt_result(test_id, attempt_id, current_user_id)
+    return await service.get_attempt_result(test_id, attempt_id, current_user_id)
 
 
 @router.get(
@@ -111,5 +111,5 @@ async def list_attempts(
     """List attempts for a test"""
     # In production: if not teacher, filter to current user only
     filter_student_id = student_id if student_id else current_user_id
-    return service.list_attempts(test_id, filter_student_id, status, offset, count)
+    return await service.list_attempts(test_id, filter_student_id, status, offset, count)
 
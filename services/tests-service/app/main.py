@@ -12,7 +12,7 @@ from app.api.v1 import tests
 from app.core.config import get_settings
 from app.core.logging_config import setup_logging, get_logger
 from app.core.metrics import setup_metrics
-from app.db.session import init_db
+from app.db.session import init_db, close_db
 
 
 settings = get_settings()
@@ -35,7 +35,7 @@ async def lifespan(app: FastAPI):
     })
     
     try:
-        init_db()
+        await init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}", exc_info=True)
@@ -44,6 +44,7 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Tests Service")
+    await close_db()
 
 
 app = FastAPI(
@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Optional, List, Tuple, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models import Test, TestQuestion, TestAttempt, TestAnswer, TestStatus, AttemptStatus
 from app.models.schemas import TestCreate, TestQuestionCreate, AnswerSubmit
@@ -15,12 +15,12 @@ from app.models.schemas import TestCreate, TestQuestionCreate, AnswerSubmit
 class TestsRepository:
     """Repository for tests, questions, attempts, and answers"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # ============= Test Methods =============
     
-    def create_test(self, course_id: UUID, data: TestCreate) -> Test:
+    async def create_test(self, course_id: UUID, data: TestCreate) -> Test:
         """Create a new test with questions"""
         # Calculate max_score from questions
         max_score = sum(q.max_score for q in data.questions)
@@ -35,7 +35,7 @@ class TestsRepository:
             status=TestStatus.DRAFT
         )
         self.db.add(test)
-        self.db.flush()
+        await self.db.flush()
         
         # Create questions
         for index, question_data in enumerate(data.questions):
@@ -51,48 +51,55 @@ class TestsRepository:
             )
             self.db.add(question)
         
-        self.db.commit()
-        self.db.refresh(test)
+        await self.db.commit()
+        await self.db.refresh(test)
         return test
     
-    def get_test(self, test_id: UUID) -> Optional[Test]:
+    async def get_test(self, test_id: UUID) -> Optional[Test]:
         """Get test by ID"""
-        return self.db.query(Test).filter(Test.id == test_id).first()
+        result = await self.db.execute(select(Test).where(Test.id == test_id))
+        return result.scalars().first()
     
-    def publish_test(
+    async def publish_test(
         self,
         test_id: UUID,
         available_from: Optional[datetime] = None,
         available_to: Optional[datetime] = None
     ) -> Optional[Test]:
         """Publish a test"""
-        test = self.get_test(test_id)
+        test = await self.get_test(test_id)
         if test:
             test.status = TestStatus.PUBLISHED
             test.available_from = available_from
             test.available_to = available_to
-            self.db.commit()
-            self.db.refresh(test)
+            await self.db.commit()
+            await self.db.refresh(test)
         return test
     
-    def get_questions(self, test_id: UUID) -> List[TestQuestion]:
+    async def get_questions(self, test_id: UUID) -> List[TestQuestion]:
         """Get all questions for a test"""
-        return self.db.query(TestQuestion).filter(
-            TestQuestion.test_id == test_id
-        ).order_by(TestQuestion.order_index).all()
+        result = await self.db.execute(
+            select(TestQuestion).where(
+                TestQuestion.test_id == test_id
+            ).order_by(TestQuestion.order_index)
+        )
+        return list(result.scalars().all())
     
-    def get_question_by_local_id(self, test_id: UUID, local_id: str) -> Optional[TestQuestion]:
+    async def get_question_by_local_id(self, test_id: UUID, local_id: str) -> Optional[TestQuestion]:
         """Get question by test_id and local_id"""
-        return self.db.query(TestQuestion).filter(
-            and_(
-                TestQuestion.test_id == test_id,
-                TestQuestion.local_id == local_id
+        result = await self.db.execute(
+            select(TestQuestion).where(
+                and_(
+                    TestQuestion.test_id == test_id,
+                    TestQuestion.local_id == local_id
+                )
             )
-        ).first()
+        )
+        return result.scalars().first()
     
     # ============= Attempt Methods =============
     
-    def create_attempt(self, test_id: UUID, student_id: UUID) -> TestAttempt:
+    async def create_attempt(self, test_id: UUID, student_id: UUID) -> TestAttempt:
         """Create a new test attempt"""
         attempt = TestAttempt(
             test_id=test_id,
@@ -100,33 +107,39 @@ class TestsRepository:
             status=AttemptStatus.IN_PROGRESS
         )
         self.db.add(attempt)
-        self.db.commit()
-        self.db.refresh(attempt)
+        await self.db.commit()
+        await self.db.refresh(attempt)
         return attempt
     
-    def get_attempt(self, attempt_id: UUID) -> Optional[TestAttempt]:
+    async def get_attempt(self, attempt_id: UUID) -> Optional[TestAttempt]:
         """Get attempt by ID"""
-        return self.db.query(TestAttempt).filter(TestAttempt.id == attempt_id).first()
+        result = await self.db.execute(select(TestAttempt).where(TestAttempt.id == attempt_id))
+        return result.scalars().first()
     
-    def count_attempts(self, test_id: UUID, student_id: UUID) -> int:
+    async def count_attempts(self, test_id: UUID, student_id: UUID) -> int:
         """Count attempts for a test by a student"""
-        return self.db.query(TestAttempt).filter(
-            and_(
-                TestAttempt.test_id == test_id,
-                TestAttempt.student_id == student_id
+        return await self.db.scalar(
+            select(func.count()).select_from(TestAttempt).where(
+                and_(
+                    TestAttempt.test_id == test_id,
+                    TestAttempt.student_id == student_id
+                )
             )
-        ).count()
+        )
     
-    def get_last_attempt(self, test_id: UUID, student_id: UUID) -> Optional[TestAttempt]:
+    async def get_last_attempt(self, test_id: UUID, student_id: UUID) -> Optional[TestAttempt]:
         """Get last attempt for a test by a student"""
-        return self.db.query(TestAttempt).filter(
-            and_(
-                TestAttempt.test_id == test_id,
-                TestAttempt.student_id == student_id
-            )
-        ).order_by(TestAttempt.started_at.desc()).first()
+        result = await self.db.execute(
+            select(TestAttempt).where(
+                and_(
+                    TestAttempt.test_id == test_id,
+                    TestAttempt.student_id == student_id
+                )
+            ).order_by(TestAttempt.started_at.desc())
+        )
+        return result.scalars().first()
     
-    def finish_attempt(
+    async def finish_attempt(
         self,
         attempt_id: UUID,
         score: float,
@@ -135,7 +148,7 @@ class TestsRepository:
         grade: Optional[int] = None
     ) -> Optional[TestAttempt]:
         """Finish an attempt with results"""
-        attempt = self.get_attempt(attempt_id)
+        attempt = await self.get_attempt(attempt_id)
         if attempt:
             attempt.status = AttemptStatus.FINISHED
             attempt.finished_at = datetime.utcnow()
@@ -143,11 +156,11 @@ class TestsRepository:
             attempt.max_score = max_score
             attempt.percent = percent
             attempt.grade = grade
-            self.db.commit()
-            self.db.refresh(attempt)
+            await self.db.commit()
+            await self.db.refresh(attempt)
         return attempt
     
-    def list_attempts(
+    async def list_attempts(
         self,
         test_id: Optional[UUID] = None,
         student_id: Optional[UUID] = None,
@@ -156,27 +169,31 @@ class TestsRepository:
         count: int = 20
     ) -> Tuple[List[TestAttempt], int]:
         """List attempts with filters"""
-        query = self.db.query(TestAttempt)
+        query = select(TestAttempt)
         
         if test_id:
-            query = query.filter(TestAttempt.test_id == test_id)
+            query = query.where(TestAttempt.test_id == test_id)
         
         if student_id:
-            query = query.filter(TestAttempt.student_id == student_id)
+            query = query.where(TestAttempt.student_id == student_id)
         
         if status:
-            query = query.filter(TestAttempt.status == status)
+            query = query.where(TestAttempt.status == status)
         
-        total = query.count()
-        attempts = query.order_by(
-            TestAttempt.started_at.desc()
-        ).offset(offset).limit(count).all()
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
+        result = await self.db.execute(
+            query.order_by(
+                TestAttempt.started_at.desc()
+            ).offset(offset).limit(count)
+        )
         
-        return attempts, total
+        return list(result.scalars().all()), total
     
     # ============= Answer Methods =============
     
-    def save_answer(
+    async def save_answer(
         self,
         attempt_id: UUID,
         question_id: UUID,
@@ -186,12 +203,15 @@ class TestsRepository:
     ) -> TestAnswer:
         """Save or update an answer"""
         # Check if answer already exists
-        answer = self.db.query(TestAnswer).filter(
-            and_(
-                TestAnswer.attempt_id == attempt_id,
-                TestAnswer.question_id == question_id
+        result = await self.db.execute(
+            select(TestAnswer).where(
+                and_(
+                    TestAnswer.attempt_id == attempt_id,
+                    TestAnswer.question_id == question_id
+                )
             )
-        ).first()
+        )
+        answer = result.scalars().first()
         
         if answer:
             answer.value = value
@@ -207,13 +227,14 @@ class TestsRepository:
             )
             self.db.add(answer)
         
-        self.db.commit()
-        self.db.refresh(answer)
+        await self.db.commit()
+        await self.db.refresh(answer)
         return answer
     
-    def get_answers(self, attempt_id: UUID) -> List[TestAnswer]:
+    async def get_answers(self, attempt_id: UUID) -> List[TestAnswer]:
         """Get all answers for an attempt"""
-        return self.db.query(TestAnswer).filter(
-            TestAnswer.attempt_id == attempt_id
-        ).all()
+        result = await self.db.execute(
+            select(TestAnswer).where(TestAnswer.attempt_id == attempt_id)
+        )
+        return list(result.scalars().all())
 
@@ -26,23 +26,23 @@ class TestsService:
     def __init__(self, repo: TestsRepository):
         self.repo = repo
     
-    def create_test(self, course_id: UUID, data: TestCreate) -> TestOut:
+    async def create_test(self, course_id: UUID, data: TestCreate) -> TestOut:
         """Create a new test"""
-        test = self.repo.create_test(course_id, data)
+        test = await self.repo.create_test(course_id, data)
         return TestOut.model_validate(test)
     
-    def publish_test(self, test_id: UUID, data: TestPublishRequest) -> TestOut:
+    async def publish_test(self, test_id: UUID, data: TestPublishRequest) -> TestOut:
         """Publish a test"""
-        test = self.repo.get_test(test_id)
+        test = await self.repo.get_test(test_id)
         if not test:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Test not found")
         
-        test = self.repo.publish_test(test_id, data.available_from, data.available_to)
+        test = await self.repo.publish_test(test_id, data.available_from, data.available_to)
         return TestOut.model_validate(test)
     
-    def start_attempt(self, test_id: UUID, student_id: UUID) -> TestAttemptStartResponse:
+    async def start_attempt(self, test_id: UUID, student_id: UUID) -> TestAttemptStartResponse:
         """Start a new attempt"""
-        test = self.repo.get_test(test_id)
+        test = await self.repo.get_test(test_id)
         if not test:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Test not found")
         
@@ -59,10 +59,10 @@ class TestsService:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Test is no longer available")
         
         # Create attempt
-        attempt = self.repo.create_attempt(test_id, student_id)
+        attempt = await self.repo.create_attempt(test_id, student_id)
         
         # Get questions without correct answers
-        questions = self.repo.get_questions(test_id)
+        questions = await self.repo.get_questions(test_id)
         questions_out = [
             TestQuestionOut(
                 id=q.local_id,
@@ -88,7 +88,7 @@ class TestsService:
             questions=questions_out
         )
     
-    def submit_attempt(
+    async def submit_attempt(
         self,
         test_id: UUID,
         attempt_id: UUID,
@@ -96,7 +96,7 @@ class TestsService:
         current_user_id: UUID
     ) -> AttemptResult:
         """Submit and check answers"""
-        attempt = self.repo.get_attempt(attempt_id)
+        attempt = await self.repo.get_attempt(attempt_id)
         if not attempt:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attempt not found")
         
@@ -108,8 +108,8 @@ class TestsService:
         if attempt.status != AttemptStatus.IN_PROGRESS:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Attempt already finished")
         
-        test = self.repo.get_test(test_id)
-        questions = self.repo.get_questions(test_id)
+        test = await self.repo.get_test(test_id)
+        questions = await self.repo.get_questions(test_id)
         
         # Check answers and calculate score
         total_score = 0.0
@@ -117,14 +117,14 @@ class TestsService:
         details = []
         
         for answer_data in data.answers:
-            question = self.repo.get_question_by_local_id(test_id, answer_data.question_id)
+            question = await self.repo.get_question_by_local_id(test_id, answer_data.question_id)
             if not question:
                 continue
             
             is_correct, score = self._check_answer(question, answer_data.value)
             
             # Save answer
-            self.repo.save_answer(
+            await self.repo.save_answer(
                 attempt_id=attempt.id,
                 question_id=question.id,
                 value=answer_data.value,
@@ -149,7 +149,7 @@ class TestsService:
         grade = self._calculate_grade(percent)
         
         # Finish attempt
-        self.repo.finish_attempt(attempt_id, total_score, max_total_score, percent, grade)
+        await self.repo.finish_attempt(attempt_id, total_score, max_total_score, percent, grade)
         
         return AttemptResult(
             attempt_id=attempt.id,
@@ -196,14 +196,14 @@ class TestsService:
         else:
             return 2
     
-    def get_attempt_result(
+    async def get_attempt_result(
         self,
         test_id: UUID,
         attempt_id: UUID,
         current_user_id: UUID
     ) -> AttemptResult:
         """Get attempt result"""
-        attempt = self.repo.get_attempt(attempt_id)
+        attempt = await self.repo.get_attempt(attempt_id)
         if not attempt:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attempt not found")
         
@@ -212,8 +212,8 @@ class TestsService:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your attempt")
         
         # Get answers and questions
-        answers = self.repo.get_answers(attempt.id)
-        questions = {q.id: q for q in self.repo.get_questions(test_id)}
+        answers = await self.repo.get_answers(attempt.id)
+        questions = {q.id: q for q in await self.repo.get_questions(test_id)}
         
         details = []
         for answer in answers:
@@ -243,7 +243,7 @@ class TestsService:
             details=details
         )
     
-    def list_attempts(
+    async def list_attempts(
         self,
         test_id: UUID,
         student_id: Optional[UUID] = None,
@@ -252,7 +252,7 @@ class TestsService:
         count: int = 20
     ) -> AttemptsListResponse:
         """List attempts"""
-        attempts, total = self.repo.list_attempts(test_id, student_id, status, offset, count)
+        attempts, total = await self.repo.list_attempts(test_id, student_id, status, offset, count)
         
         items = [AttemptBriefOut.model_validate(attempt) for attempt in attempts]
         